@@ -68,11 +68,6 @@ def read_gdal_file(filehandle,band=1,gcps=False):
     geotransform = filehandle.GetGeoTransform()
     geoproj = filehandle.GetProjection()
     banddata = filehandle.GetRasterBand(band)
-    type = gdal.GetDataTypeName(banddata.DataType).lower()
-    min = banddata.GetMinimum()
-    max = banddata.GetMaximum()
-    if min is None or max is None:
-        (min,max) = banddata.ComputeRasterMinMax(1)
     data = banddata.ReadAsArray()
     if gcps==False:
         return filehandle.RasterXSize,filehandle.RasterYSize,geotransform,geoproj,data
@@ -90,7 +85,7 @@ def read_gdal_file_small(filehandle,band,xsize,ysize):
 
 def read_gdal_file_subset(filehandle,band,xsize,ysize,xoff=0,yoff=0):
         banddata = filehandle.GetRasterBand(band)
-        data = banddata.ReadAsArray(xoff,yoff,xoff+xsize,yoff+ysize,xsize,ysize)
+        data = banddata.ReadAsArray(xoff,yoff,xsize,ysize,xsize,ysize)
         return data
 
 def read_gdal_file_generic(filehandle,band,xsize,ysize):
@@ -259,11 +254,11 @@ def boxcar_y(image,bsize):
         (y,x) = image.shape
         #outimage = np.zeros([y,x],dtype=float32)
         outimage = image
-        w = np.ones(bsize)
+        w = np.ones(bsize)/bsize
         edge = int((bsize-1)/2)
         for i in range (0,y):
             progressbar(float(i)/float(y))
-            outimage[i,:] = np.convolve(w/w.sum(),image[i,:],mode='same')
+            outimage[i,:] = np.convolve(w,image[i,:],mode='same')
         #print '100'
         return outimage
         
@@ -271,11 +266,11 @@ def boxcar_x(image,bsize):
         (y,x) = image.shape
         #outimage = np.zeros([y,x],dtype=float32)
         outimage = image
-        w = np.ones(bsize)
+        w = np.ones(bsize)/bsize
         edge = int((bsize-1)/2)
         for j in range (0,x):
             progressbar(float(j)/float(x))
-            outimage[:,j] = np.convolve(w/w.sum(),image[:,j],mode='same')
+            outimage[:,j] = np.convolve(w,image[:,j],mode='same')
         #print '100'
         return outimage
 
@@ -202,8 +202,8 @@ def vrt_to_gtiff(vrt: str, output: str):
         return
     if '.' not in output:
         output = f"{output}.tif"
-    elif len(output) > 4 and (output[:-3] == 'tif' or output[:-4] == 'tiff'):
-        print('Error: the output argument must either not contain a ' /
+    elif not (output.endswith('.tif') or output.endswith('.tiff')):
+        print('Error: the output argument must either not contain a '
               'file extension, or have a "tif" or "tiff" file extension.')
         return
 
@@ -456,11 +456,17 @@ def filter_jobs_by_orbit(jobs, orbit_direction):
 #   Product Related Utility Functions #
 #######################################
 
+_PRODUCT_DATE_REGEX = re.compile("\w[0-9]{7}T[0-9]{6}")
+
 def get_product_info(granules: dict, products_info: list, date_range: list) -> dict:
     paths = []
     directions = []
     urls = []
     vertex_API_URL = "https://api.daac.asf.alaska.edu/services/search/param"
+    products_by_queue_id = {}
+    for p_info in products_info:
+        # keep the first product seen for each queue id
+        products_by_queue_id.setdefault(p_info['local_queue_id'], p_info)
     for granule_name in granules:
         dt = date_from_product_name(granule_name)
         if dt:
@@ -483,21 +489,19 @@ def get_product_info(granules: dict, products_info: list, date_range: list) -> d
                 if response.json()[0]:
                     json_response = response.json()[0][0]
                 local_queue_id = granules[granule_name]
-                for p_info in products_info:
-                    if p_info['local_queue_id'] == local_queue_id:
-                        try:
-                            paths.append(json_response['track'])
-                            directions.append(json_response['flightDirection'])
-                            urls.append(p_info['url'])
-                        except TypeError:
-                            print(f"TypeError: json_response for {granule_name}: {json_response}")
-                            pass
-                        break
+                p_info = products_by_queue_id.get(local_queue_id)
+                if p_info:
+                    try:
+                        paths.append(json_response['track'])
+                        directions.append(json_response['flightDirection'])
+                        urls.append(p_info['url'])
+                    except TypeError:
+                        print(f"TypeError: json_response for {granule_name}: {json_response}")
+                        pass
     return {'paths': paths, 'directions': directions, 'urls': urls}
 
 def date_from_product_name(product_name: str) -> str:
-    regex = "\w[0-9]{7}T[0-9]{6}"
-    results = re.search(regex, product_name)
+    results = _PRODUCT_DATE_REGEX.search(product_name)
     if results:
         return results.group(0)
     else:
@@ -506,34 +510,30 @@ def date_from_product_name(product_name: str) -> str:
 def get_products_dates(products_info: list) -> list:
     dates = []
     for info in products_info:
-        date_regex = "\w[0-9]{7}T[0-9]{6}"
-        date_strs = re.findall(date_regex, info['granule'])
+        date_strs = _PRODUCT_DATE_REGEX.findall(info['granule'])
         if date_strs:
             for d in date_strs:
                 dates.append(d[0:8])
-    dates.sort()
-    dates = list(set(dates))
-    return dates
+    return sorted(set(dates))
 
 # get_products_dates_insar will be deprecated in the
 # near future as it is now duplicted in get_products_dates
 def get_products_dates_insar(products_info: list) -> list:
     dates = []
     for info in products_info:
-        date_regex = "\w[0-9]{7}T[0-9]{6}"
-        date_strs = re.findall(date_regex, info['granule'])
+        date_strs = _PRODUCT_DATE_REGEX.findall(info['granule'])
         if date_strs:
             for d in date_strs:
                 dates.append(d[0:8])
-    dates.sort()
-    dates = list(set(dates))
-    return dates
+    return sorted(set(dates))
 
 
 ######################################
 #  Jupyter Notebook Widget Functions #
 ######################################
 
+_POLARITY_REGEX = re.compile("(v|V|h|H){2}")
+
 
 def gui_date_picker(dates: list) -> widgets.SelectionRangeSlider:
     start_date = datetime.strptime(min(dates), '%Y%m%d')
@@ -570,8 +570,7 @@ def get_polarity_from_path(path: str) -> str:
     Returns the polarity string or none if not found
     """
     path = os.path.basename(path)
-    regex = "(v|V|h|H){2}"
-    return re.search(regex, path).group(0)
+    return _POLARITY_REGEX.search(path).group(0)
 
 
 def get_RTC_polarizations(base_path: str) -> list:
@@ -581,12 +580,13 @@ def get_RTC_polarizations(base_path: str) -> list:
     """
     assert type(base_path) == str, 'Error: base_path must be a string.'
     assert os.path.exists(base_path), f"Error: select_RTC_polarization was passed an invalid base_path, {base_path}"
+    polar_regex = re.compile("^\w[\--~]{5,300}(_|-)(vv|VV|vh|VH|hh|HH|hv|HV).(tif|tiff)$")
     paths = []
     pths = glob.glob(f"{base_path}/*/*.tif")
     if len(pths) > 0:
         for p in pths:
             filename = os.path.basename(p)
-            polar_fname = re.search("^\w[\--~]{5,300}(_|-)(vv|VV|vh|VH|hh|HH|hv|HV).(tif|tiff)$", filename)
+            polar_fname = polar_regex.search(filename)
             if polar_fname:
                 paths.append(polar_fname.string.split('.')[0][-2:])
     if len(paths) > 0:
@@ -16,12 +16,14 @@ def gdal_interferogram(folder_in=None, name=''):
 
     #amp = np.sqrt(np.sqrt(np.power(idata,2) + np.power(qdata,2)))
     amp = np.log10((np.sqrt(np.sqrt(np.power(idata,2) + np.power(qdata,2)))+1)/100000000)
-    amp = (amp - np.min(amp))
-    ma = amp[amp != 0]
-    amp = amp - np.min(ma)
+    amp -= np.min(amp)
+    # shift by the smallest nonzero value, in place to avoid a second full-size copy
+    amp -= np.min(amp[amp != 0])
     #amp = np.where(amp < 0, amp, 0)
-    amp = amp/np.max(amp)*255
-    phase = (np.arctan2(qdata,idata)+np.pi)/(2*np.pi)*255
+    amp *= 255.0/np.max(amp)
+    phase = np.arctan2(qdata,idata)
+    phase += np.pi
+    phase *= 255.0/(2*np.pi)
 
 
     saa.write_gdal_file_byte(os.path.join(folder_in, f'amplitude{name}.tif'),trans,proj,amp)